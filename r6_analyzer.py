@@ -0,0 +1,515 @@
+from __future__ import annotations
+
+from collections import Counter
+from functools import cached_property
+from operator import itemgetter
+
+# typing is only needed by type checkers, so it is not imported at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+# Shared fallback for missing or null lists in the match data
+_EMPTY = ()
+
+# Event type tags of the flattened round feedback
+_KILL, _TEAMKILL, _ROUND_START, _ROUND_END, _OPERATOR_SWAP, _OTHER_EVENT = range(6)
+_EVENT_TAGS = {
+    'Kill': _KILL,
+    'TeamKill': _TEAMKILL,
+    'RoundStart': _ROUND_START,
+    'RoundEnd': _ROUND_END,
+    'OperatorSwap': _OPERATOR_SWAP
+}
+
+def _parse_time_to_seconds(time_str: Any) -> float:
+    """Convert an event timestamp (seconds or an MM:SS string) to seconds"""
+    if isinstance(time_str, (int, float)):
+        return float(time_str)
+    elif isinstance(time_str, str):
+        # Handle MM:SS format
+        if ':' in time_str:
+            parts = time_str.split(':')
+            if len(parts) == 2:
+                try:
+                    minutes = int(parts[0])
+                    seconds = int(parts[1])
+                    return minutes * 60 + seconds
+                except ValueError:
+                    print(f"Warning: Could not parse time string: {time_str}")
+                    return 0
+        # Try parsing as a straight number
+        try:
+            return float(time_str)
+        except ValueError:
+            print(f"Warning: Could not parse time: {time_str}")
+            return 0
+    return 0
+
+class R6StatsAnalyzer:
+    def __init__(self, match_data: dict[str, Any]):
+        """
+        Initialize the analyzer with match data
+        
+        :param match_data: JSON data containing match information
+        """
+        self.match_data = match_data
+        self.rounds = match_data.get('rounds', [])
+        self.overall_stats = match_data.get('stats', [])
+        # Columns of the overall stats, aligned by position
+        self._usernames = [stat.get('username', 'Unknown') for stat in self.overall_stats]
+        self._kills = [stat.get('kills', 0) for stat in self.overall_stats]
+        self._rounds_played = [stat.get('rounds', 0) for stat in self.overall_stats]
+        
+        # Usernames interned to contiguous ids, players from the overall stats first
+        self._players = []
+        self._player_ids = {}
+        self._row_player_ids = [self._player_id(username) for username in self._usernames]
+        self._listed_players = len(self._players)
+        
+        # Per round, the (player id, team index) roster and the (player id, survived) stats
+        self._round_rosters = []
+        self._round_stats = []
+        for round_data in self.rounds:
+            roster = []
+            for player in round_data.get('players') or _EMPTY:
+                if isinstance(player, dict) and 'username' in player:
+                    player_id = self._player_id(player['username'])
+                    if 'teamIndex' in player:
+                        roster.append((player_id, player['teamIndex']))
+            self._round_rosters.append(roster)
+            self._round_stats.append([
+                (self._player_id(player_stat.get('username', 'Unknown')), not player_stat.get('died', True))
+                for player_stat in round_data.get('stats') or _EMPTY if isinstance(player_stat, dict)
+            ])
+        
+        # Round timelines and summaries, filled in as rounds are viewed
+        self._events_cache = {}
+        self._summary_cache = {}
+        
+    def calculate_kpr(self) -> dict[str, float]:
+        """Calculate Kills per Round for each player"""
+        kpr = self._kpr
+        return {username: kpr[i] for i, username in enumerate(self._players[:self._listed_players])}
+
+    def calculate_multikills(self) -> dict[str, int]:
+        """Calculate number of multikills for each player"""
+        return self._counter_by_username('multikills')
+
+    def calculate_clutches(self) -> dict[str, int]:
+        """
+        Calculate 1vX clutch rounds for each player
+        
+        A clutch is defined as a situation where a player is the last alive on their team
+        and successfully wins the round against multiple opponents.
+        """
+        return self._counter_by_username('clutches')
+
+    def calculate_opening_picks(self) -> dict[str, dict[str, int]]:
+        """
+        Calculate opening kills and deaths for each player.
+        
+        :return: Dictionary of username to opening kills and deaths.
+        """
+        opening_kills = self._aggregates['opening_kills']
+        opening_deaths = self._aggregates['opening_deaths']
+        return {username: {"opening_kills": opening_kills[i], "opening_deaths": opening_deaths[i]}
+                for i, username in enumerate(self._players)
+                if i < self._listed_players or opening_kills[i] or opening_deaths[i]}
+
+    def calculate_kost(self) -> dict[str, float]:
+        """Calculate KOST (Kill, Objective, Survived, Traded) percentage"""
+        inv_rounds = 1.0 / max(len(self.rounds), 1)  # Avoid division by zero
+        return {username: count * inv_rounds for username, count in self._counter_by_username('kost_rounds').items()}
+
+    def _counter_by_username(self, name: str) -> dict[str, int]:
+        """Map one of the aggregated per-player counters back to usernames"""
+        values = self._aggregates[name]
+        return {username: value for i, (username, value) in enumerate(zip(self._players, values))
+                if i < self._listed_players or value}
+
+    def _player_id(self, username: str) -> int:
+        """Return the interned id of a username, assigning the next free one if needed"""
+        player_id = self._player_ids.get(username)
+        if player_id is None:
+            player_id = self._player_ids[username] = len(self._players)
+            self._players.append(username)
+        return player_id
+
+    @cached_property
+    def _kpr(self) -> list[float]:
+        """Kills per Round indexed by player id"""
+        kpr = [0.0] * len(self._players)
+        for player_id, kills, rounds in zip(self._row_player_ids, self._kills, self._rounds_played):
+            kpr[player_id] = kills / rounds if rounds > 0 else 0.0
+        return kpr
+
+    @staticmethod
+    def _normalize_round(round_data: dict[str, Any]) -> tuple[list[tuple], Any]:
+        """
+        Flatten a round's match feedback into tuples so later passes avoid nested lookups
+        
+        Each event becomes (type tag, type name, username, target, detail, timestamp in seconds).
+        The detail holds what the event description needs: (weapon, headshot) for kills
+        and team kills, the winner for round ends, (from, to) operators for swaps.
+        
+        :param round_data: Round to normalize
+        :return: The normalized events and the winner named by the first RoundEnd event
+        """
+        events = []
+        winning_team = None
+        round_ended = False
+        for event in round_data.get('matchFeedback') or _EMPTY:
+            if not isinstance(event, dict):
+                continue
+            
+            event_type = event.get('type', {}).get('name')
+            tag = _EVENT_TAGS.get(event_type, _OTHER_EVENT)
+            detail = None
+            if tag == _KILL or tag == _TEAMKILL:
+                detail = (event.get('weapon', {}).get('name', 'Unknown weapon'), bool(event.get('headshot')))
+            elif tag == _ROUND_END:
+                detail = event.get('winner', 'Unknown')
+                if not round_ended:
+                    winning_team = event.get('winner')
+                    round_ended = True
+            elif tag == _OPERATOR_SWAP:
+                detail = (event.get('fromOperator', {}).get('name', 'Unknown'), event.get('toOperator', {}).get('name', 'Unknown'))
+            
+            # Look for timestamp in both 'timestamp' and 'time' fields
+            timestamp = _parse_time_to_seconds(event.get('timestamp') or event.get('time', 0))
+            events.append((tag, event_type, event.get('username', 'Unknown'), event.get('target'), detail, timestamp))
+        return events, winning_team
+
+    @cached_property
+    def _round_feedback(self) -> list[tuple[list[tuple], Any]]:
+        """Per round, the normalized feedback events and the round's winner"""
+        return [self._normalize_round(round_data) for round_data in self.rounds]
+
+    @cached_property
+    def _round_kills(self) -> list[list[tuple[int, int, int]]]:
+        """Per round, the (type tag, killer id, target id) of every Kill and TeamKill event; -1 marks a missing target"""
+        return [
+            [(tag, self._player_id(username), self._player_id(target) if target is not None else -1)
+             for tag, _, username, target, _, _ in round_events if tag == _KILL or tag == _TEAMKILL]
+            for round_events, _ in self._round_feedback
+        ]
+
+    @cached_property
+    def _aggregates(self) -> dict[str, list[int]]:
+        """
+        Walk every round once and accumulate all per-round player counters
+        
+        Multikills, clutches, opening picks and KOST rounds are collected in a single
+        pass into parallel lists indexed by player id.
+        
+        :return: Dictionary of counter name to list of per-player values
+        """
+        # Building the kill cache may intern new players, so size the counters after it
+        round_kills = self._round_kills
+        n_players = len(self._players)
+        multikills = [0] * n_players
+        clutches = [0] * n_players
+        opening_kills = [0] * n_players
+        opening_deaths = [0] * n_players
+        kost_rounds = [0] * n_players
+        
+        rounds = zip(self.rounds, self._round_feedback, round_kills, self._round_rosters, self._round_stats)
+        for round_data, (_, winning_team), kills, roster, round_stats in rounds:
+            # Kill counts per player; its keys double as the round's killers for KOST
+            kills_by_player = Counter(killer for tag, killer, _ in kills if tag == _KILL)
+            for killer, kill_count in kills_by_player.items():
+                if kill_count > 1:
+                    multikills[killer] += 1
+            
+            for tag, killer, victim in kills:
+                if tag == _KILL:
+                    if victim >= 0:
+                        opening_kills[killer] += 1
+                        opening_deaths[victim] += 1
+                    break
+            
+            for player_id, survived in round_stats:
+                if survived or player_id in kills_by_player:
+                    kost_rounds[player_id] += 1
+            
+            clutch_player = self._find_clutch_player(round_data.get('teams') or _EMPTY, roster, kills, winning_team)
+            if clutch_player is not None:
+                clutches[clutch_player] += 1
+        
+        return {
+            'multikills': multikills,
+            'clutches': clutches,
+            'opening_kills': opening_kills,
+            'opening_deaths': opening_deaths,
+            'kost_rounds': kost_rounds
+        }
+
+    def _find_clutch_player(self, teams: list[Any], roster: list[tuple[int, Any]], kills: list[tuple[int, int, int]], winning_team: Any) -> int | None:
+        """
+        Find the player who won a 1vX clutch in a round
+        
+        The round's kills are replayed once: alive players are tracked per team and the
+        clutch player's kills are counted from the moment they became the last one alive.
+        
+        :param teams: The round's team objects
+        :param roster: The round's (player id, team index) pairs
+        :param kills: The round's (type tag, killer id, target id) kill events
+        :param winning_team: Name of the team that won the round
+        :return: Player id of the clutch player, or None if the round was no clutch
+        """
+        if len(teams) < 2 or winning_team is None:
+            return None  # Can't determine winning team
+            
+        # Team of each rostered player, plus a bitmask of each team's players
+        # (bit i standing for player id i) and how many of them are alive
+        player_to_team = {}
+        alive_masks = {}
+        alive_counts = {}
+        for player_id, team_id in roster:
+            player_to_team.setdefault(player_id, team_id)
+            player_bit = 1 << player_id
+            mask = alive_masks.get(team_id, 0)
+            if not mask & player_bit:
+                alive_masks[team_id] = mask | player_bit
+                alive_counts[team_id] = alive_counts.get(team_id, 0) + 1
+        
+        # Find which team_id corresponds to the winning team name
+        winning_team_id = None
+        for team_id, team_obj in enumerate(teams):
+            if isinstance(team_obj, dict) and team_obj.get('name') == winning_team:
+                winning_team_id = team_id
+                break
+        
+        if winning_team_id is None:
+            return None  # Can't determine winning team ID
+        
+        if winning_team_id not in alive_masks:
+            return None  # Nobody on the winning team to clutch
+        
+        # Process kills chronologically to track who's alive
+        total_alive = sum(alive_counts.values())
+        clutch_candidate = None
+        enemy_count_at_clutch_start = 0
+        clutch_started = False
+        kills_after_clutch = 0
+        
+        for tag, killer_id, target_id in kills:
+            if clutch_started and tag == _KILL and killer_id == clutch_candidate:
+                kills_after_clutch += 1
+            
+            # Update alive players based on who died
+            target_team = player_to_team.get(target_id)
+            if target_team is None:
+                continue
+            
+            target_bit = 1 << target_id
+            if alive_masks[target_team] & target_bit:
+                alive_masks[target_team] &= ~target_bit
+                alive_counts[target_team] -= 1
+                total_alive -= 1
+            
+            # Check if this creates a clutch situation
+            if target_team == winning_team_id and alive_counts[winning_team_id] == 1 and not clutch_started:
+                clutch_candidate = alive_masks[winning_team_id].bit_length() - 1
+                # Count alive enemies at clutch start
+                enemy_count_at_clutch_start = total_alive - 1
+                
+                # Only consider it a potential clutch if there are multiple enemies
+                if enemy_count_at_clutch_start >= 2:
+                    clutch_started = True
+        
+        # The winning team must still have a single player at the end, and that player
+        # must have got at least one kill in the clutch or faced 3+ enemies
+        if clutch_started and alive_counts[winning_team_id] == 1:
+            if kills_after_clutch > 0 or enemy_count_at_clutch_start >= 3:
+                return clutch_candidate
+        
+        return None
+
+    def generate_player_performance_report(self) -> list[dict[str, Any]]:
+        """Generate a comprehensive performance report for each player"""
+        kpr = self._kpr
+        aggregates = self._aggregates
+        multikills = aggregates['multikills']
+        clutches = aggregates['clutches']
+        opening_kills = aggregates['opening_kills']
+        opening_deaths = aggregates['opening_deaths']
+        kost_rounds = aggregates['kost_rounds']
+        inv_rounds = 1.0 / max(len(self.rounds), 1)
+        
+        report = []
+        for stat, i in zip(self.overall_stats, self._row_player_ids):
+            if not isinstance(stat, dict):
+                continue
+                
+            player_report = {
+                'Username': self._players[i],
+                'Kills per Round': kpr[i],
+                'Multikills': multikills[i],
+                'Clutches': clutches[i],
+                'Opening Kills': opening_kills[i],
+                'Opening Deaths': opening_deaths[i],
+                'KOST %': kost_rounds[i] * inv_rounds * 100,
+                'Total Kills': stat.get('kills', 0),
+                'Total Deaths': stat.get('deaths', 0)
+            }
+            report.append(player_report)
+        
+        return report
+
+    def generate_report_rows(self) -> list[tuple]:
+        """
+        Generate the performance report as display-ready rows
+        
+        :return: One tuple per player in report column order, with KPR and KOST % formatted to two decimals
+        """
+        kpr = self._kpr
+        aggregates = self._aggregates
+        multikills = aggregates['multikills']
+        clutches = aggregates['clutches']
+        opening_kills = aggregates['opening_kills']
+        opening_deaths = aggregates['opening_deaths']
+        kost_rounds = aggregates['kost_rounds']
+        inv_rounds = 1.0 / max(len(self.rounds), 1)
+        
+        return [(
+            self._players[i],
+            f"{kpr[i]:.2f}",
+            multikills[i],
+            clutches[i],
+            opening_kills[i],
+            opening_deaths[i],
+            f"{kost_rounds[i] * inv_rounds * 100:.2f}",
+            stat.get('kills', 0),
+            stat.get('deaths', 0)
+        ) for stat, i in zip(self.overall_stats, self._row_player_ids) if isinstance(stat, dict)]
+        
+    def get_round_events(self, round_index: int) -> list[dict[str, Any]]:
+        """
+        Get a chronological list of events that occurred in a specific round
+        
+        :param round_index: Index of the round to analyze
+        :return: List of event dictionaries with timestamp, type, and description
+        """
+        if round_index < 0 or round_index >= len(self.rounds):
+            return []
+        if round_index in self._events_cache:
+            return self._events_cache[round_index]
+            
+        round_events, _ = self._round_feedback[round_index]
+        events = []
+        
+        # Find the start timestamp for relative timing
+        start_time = 0
+        for tag, _, _, _, _, timestamp in round_events:
+            if tag == _ROUND_START:
+                start_time = timestamp
+                break
+        
+        out_of_order = False
+        for tag, event_type, username, target, detail, timestamp in round_events:
+            if events and timestamp < events[-1]['timestamp']:
+                out_of_order = True
+            
+            # Calculate relative time from round start
+            relative_time = max(0, timestamp - start_time)
+            
+            # Format timestamp as MM:SS
+            minutes = int(relative_time // 60)
+            seconds = int(relative_time % 60)
+            time_str = f"{minutes:02d}:{seconds:02d}"
+            
+            description = "Unknown event"
+            
+            if tag == _KILL:
+                weapon, headshot = detail
+                headshot = "HEADSHOT" if headshot else ""
+                description = f"{username} killed {'Unknown' if target is None else target} with {weapon} {headshot}"
+            elif tag == _TEAMKILL:
+                weapon, _ = detail
+                description = f"TEAMKILL: {username} killed {'Unknown' if target is None else target} with {weapon}"
+            elif event_type == 'Death':
+                description = f"{username} died"
+            elif tag == _ROUND_START:
+                description = "Round Started"
+            elif tag == _ROUND_END:
+                description = f"Round Ended - Winner: {detail}"
+            elif tag == _OPERATOR_SWAP:
+                from_operator, to_operator = detail
+                description = f"{username} swapped from {from_operator} to {to_operator}"
+            
+            events.append({
+                'timestamp': timestamp,
+                'time_str': time_str,
+                'type': event_type,
+                'description': description
+            })
+        
+        # Sort events by timestamp; feedback is usually in order already
+        if out_of_order:
+            events.sort(key=itemgetter('timestamp'))
+        
+        self._events_cache[round_index] = events
+        return events
+    
+    def get_round_summary(self, round_index: int) -> dict[str, Any]:
+        """
+        Get a summary of a specific round
+        
+        :param round_index: Index of the round to analyze
+        :return: Dictionary with round summary information
+        """
+        if round_index < 0 or round_index >= len(self.rounds):
+            return {}
+        if round_index in self._summary_cache:
+            return self._summary_cache[round_index]
+            
+        round_data = self.rounds[round_index]
+        
+        # Get basic round info
+        round_number = round_index + 1
+        map_name = round_data.get('map', {}).get('name', 'Unknown Map')
+        
+        # Get teams
+        teams = round_data.get('teams') or _EMPTY
+        team_names = []
+        for team in teams:
+            if isinstance(team, dict):
+                team_names.append(team.get('name', 'Unknown Team'))
+        
+        # Determine winner
+        round_events, _ = self._round_feedback[round_index]
+        winner = "Unknown"
+        for tag, _, _, _, detail, _ in round_events:
+            if tag == _ROUND_END:
+                winner = detail
+                break
+        
+        # Team name of each player, taken from their first roster entry
+        user_to_team_name = {}
+        for player in round_data.get('players') or _EMPTY:
+            if not isinstance(player, dict) or player.get('username') in user_to_team_name:
+                continue
+                
+            team_index = player.get('teamIndex')
+            if team_index is not None and team_index < len(teams):
+                user_to_team_name[player.get('username')] = teams[team_index].get('name', 'Unknown Team')
+            else:
+                user_to_team_name[player.get('username')] = "Unknown"
+        
+        # Count kills per team
+        team_kills = dict(Counter(
+            user_to_team_name.get(username, "Unknown")
+            for tag, _, username, _, _, _ in round_events if tag == _KILL
+        ))
+        
+        summary = {
+            'round_number': round_number,
+            'map': map_name,
+            'teams': team_names,
+            'winner': winner,
+            'team_kills': team_kills
+        }
+        self._summary_cache[round_index] = summary
+        return summary